@@ -97,6 +97,11 @@ def render_kit_frame_post(scene):
 	
 	# Store processed render path for checking against during a video sequence
 	settings.autosave_video_render_path = scene.render.filepath
-	settings.autosave_video_prores_path = replaceVariables(settings.autosave_video_prores_location)
-	settings.autosave_video_mp4_path = replaceVariables(settings.autosave_video_mp4_location)
-	settings.autosave_video_custom_path = replaceVariables(settings.autosave_video_custom_location)
+	# Video output paths are only read by processFFmpeg, so variables are only replaced for outputs that will actually be compiled
+	if prefs.ffmpeg_processing and prefs.ffmpeg_exists:
+		if settings.autosave_video_prores:
+			settings.autosave_video_prores_path = replaceVariables(settings.autosave_video_prores_location)
+		if settings.autosave_video_mp4:
+			settings.autosave_video_mp4_path = replaceVariables(settings.autosave_video_mp4_location)
+		if settings.autosave_video_custom:
+			settings.autosave_video_custom_path = replaceVariables(settings.autosave_video_custom_location)
@@ -8,13 +8,16 @@ import json
 import os
 
 # Variable data
-from re import findall, M as multiline
+from re import compile as re_compile, M as multiline
 
 # Local imports
 from .render_variables import replaceVariables
 from .utility_notifications import render_notifications
 from .utility_time import secondsToReadable, readableToSeconds
 
+# Serial number suffix pattern, compiled once instead of per file when scanning the autosave folder
+SERIAL_SUFFIX_PATTERN = re_compile(r'\d{4,}$', multiline)
+
 # Format validation lists
 IMAGE_FORMATS = (
 	'BMP',
@@ -126,12 +129,9 @@ def render_kit_end(scene):
 			if original_format not in IMAGE_FORMATS:
 				print('Render Kit: {} is not an image format. Image not saved.'.format(original_format))
 				return {'CANCELLED'}
-		elif file_format == 'JPEG':
-			scene.render.image_settings.file_format = 'JPEG'
-		elif file_format == 'PNG':
-			scene.render.image_settings.file_format = 'PNG'
-		elif file_format == 'OPEN_EXR':
-			scene.render.image_settings.file_format = 'OPEN_EXR'
+		else:
+			# Override values match the Blender format identifiers, so they can be assigned directly
+			scene.render.image_settings.file_format = file_format
 		extension = scene.render.file_extension
 		
 		# Get location variable with override and project path replacement
@@ -164,8 +164,7 @@ def render_kit_end(scene):
 		filepath = replaceVariables(filepath, render_time=render_time, serial=serialNumber)
 		
 		# Create the project subfolder if it doesn't already exist (otherwise subsequent operations will fail)
-		if not os.path.exists(filepath):
-			os.makedirs(filepath)
+		os.makedirs(filepath, exist_ok=True)
 		
 		# Get file name type with override
 		if prefs.override_autosave_render:
@@ -177,7 +176,9 @@ def render_kit_end(scene):
 		if file_name_type == 'SERIAL':
 			# Generate dynamic serial number
 			# Finds all of the image files that start with projectname in the selected directory
-			files = [f for f in os.listdir(filepath) if f.startswith(projectname) and f.lower().endswith(IMAGE_EXTENSIONS)]
+			# Name checks run first, then the file type cached by scandir skips folders without extra stat calls
+			with os.scandir(filepath) as entries:
+				files = [entry.name for entry in entries if entry.name.startswith(projectname) and entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()]
 			
 			# Searches the file collection and returns the next highest number as a 4 digit string
 			def save_number_from_files(files):
@@ -185,7 +186,7 @@ def render_kit_end(scene):
 				if files:
 					for f in files:
 						# find filenames that end with four or more digits
-						suffix = findall(r'\d{4,}$', os.path.splitext(f)[0].split(projectname)[-1], multiline)
+						suffix = SERIAL_SUFFIX_PATTERN.findall(os.path.splitext(f)[0].split(projectname)[-1])
 						if suffix:
 							if int(suffix[-1]) > highest:
 								highest = int(suffix[-1])
@@ -225,7 +226,7 @@ def render_kit_end(scene):
 		filepath = os.path.join(filepath, filename) + extension
 		
 		# Save image file
-		image = bpy.data.images['Render Result']
+		image = bpy.data.images.get('Render Result')
 		if not image:
 			print('Render Kit: Render Result not found. Image not saved.')
 			return {'CANCELLED'}
@@ -251,13 +252,14 @@ def render_kit_end(scene):
 		logtime = 0.00
 		
 		# Get previous time spent rendering, if log file exists, and convert formatted string into seconds
-		if os.path.exists(logpath):
+		# Opening the file directly avoids a separate existence check for every render
+		try:
 			with open(logpath) as filein:
 				logtime = filein.read().replace(logtitle, '')
 				logtime = readableToSeconds(logtime)
 		# Create log file directory location if it doesn't exist
-		elif not os.path.exists(os.path.dirname(logpath)): # Safety net just in case a folder was included in the file name entry
-			os.makedirs(os.path.dirname(logpath))
+		except FileNotFoundError:
+			os.makedirs(os.path.dirname(logpath), exist_ok=True) # Safety net just in case a folder was included in the file name entry
 		
 		# Add the latest render time
 		logtime += float(render_time)
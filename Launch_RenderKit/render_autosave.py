@@ -36,12 +36,15 @@ class RENDER_PT_autosave_image(bpy.types.Panel):
 		prefs = context.preferences.addons[__package__].preferences
 		settings = context.scene.render_kit_settings
 		
+		# Read the override state once, it's checked by every section below
+		override_global = prefs.override_autosave_render
+		
 		layout = self.layout
 		layout.use_property_decorate = False  # No animation
 		
 		# Combine all used paths for variable checks
 		paths = ''
-		if prefs.override_autosave_render:
+		if override_global:
 			paths += prefs.file_location_global
 			if prefs.file_name_type_global == 'CUSTOM':
 				paths += prefs.file_name_custom_global
@@ -56,7 +59,7 @@ class RENDER_PT_autosave_image(bpy.types.Panel):
 		layout.use_property_split = True
 		
 		# File location with global override
-		if prefs.override_autosave_render:
+		if override_global:
 			override = layout.row()
 			override.use_property_split = True
 			override.active = False
@@ -69,7 +72,7 @@ class RENDER_PT_autosave_image(bpy.types.Panel):
 			layout.use_property_split = True
 			
 		# File name with global override
-		if prefs.override_autosave_render:
+		if override_global:
 			override = layout.row()
 			override.active = False
 			override.prop(prefs, 'file_name_type_global', icon='FILE_TEXT')
@@ -83,7 +86,7 @@ class RENDER_PT_autosave_image(bpy.types.Panel):
 				layout.prop(settings, 'file_name_custom')
 				
 		# File format with global override
-		if prefs.override_autosave_render:
+		if override_global:
 			override = layout.row()
 			override.active = False
 			override.prop(prefs, 'file_format_global', icon='FILE_IMAGE')
@@ -91,7 +94,7 @@ class RENDER_PT_autosave_image(bpy.types.Panel):
 			layout.prop(settings, 'file_format', icon='FILE_IMAGE')
 			
 		# Multilayer EXR warning
-		if context.scene.render.image_settings.file_format == 'OPEN_EXR_MULTILAYER' and (prefs.file_format_global == 'SCENE' and prefs.override_autosave_render or settings.file_format == 'SCENE' and not prefs.override_autosave_render):
+		if context.scene.render.image_settings.file_format == 'OPEN_EXR_MULTILAYER' and (prefs.file_format_global == 'SCENE' and override_global or settings.file_format == 'SCENE' and not override_global):
 			error = layout.box()
 			error.label(text="Python API can only save single layer EXR files")
 			error.label(text="Report: https://developer.blender.org/T71087")
@@ -122,9 +125,10 @@ class RENDER_PT_autosave_video(bpy.types.Panel):
 		layout.use_property_decorate = False  # No animation
 		
 		# Check if the output format is supported by FFmpeg
-		if not context.scene.render.image_settings.file_format in FFMPEG_FORMATS:
+		file_format = context.scene.render.image_settings.file_format
+		if not file_format in FFMPEG_FORMATS:
 			error = layout.box()
-			error.label(text='"' + context.scene.render.image_settings.file_format + '" output format is not supported by FFmpeg')
+			error.label(text='"' + file_format + '" output format is not supported by FFmpeg')
 			error.label(text="Supported image formats: " + ', '.join(FFMPEG_FORMATS))
 			layout = layout.column()
 			layout.active = False
@@ -133,8 +137,8 @@ class RENDER_PT_autosave_video(bpy.types.Panel):
 		# Combine all used paths for variable checks
 		paths = ''
 		paths += settings.autosave_video_prores_location if settings.autosave_video_prores else ''
-		paths += settings.autosave_video_mp4_location if settings.autosave_video_prores else ''
-		paths += settings.autosave_video_custom_location if settings.autosave_video_prores else ''
+		paths += settings.autosave_video_mp4_location if settings.autosave_video_mp4 else ''
+		paths += settings.autosave_video_custom_location if settings.autosave_video_custom else ''
 		
 		# Variable list UI
 		renderkit_variable_ui(layout, context, paths=paths, postrender=True, noderender=False, autoclose=True)
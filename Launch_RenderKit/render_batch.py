@@ -1,6 +1,46 @@
 import bpy
 import os
 from re import search
+from stat import S_ISDIR
+
+# Supported image extensions for batch rendering images
+# •Image extensions attribute is undocumented: https://blenderartists.org/t/bpy-ops-image-open-supported-formats/1237197/6
+# •Converted to a tuple once here instead of for every file checked
+BATCH_IMAGE_EXTENSIONS = tuple(bpy.path.extensions_image)
+
+# Cached batch image listing (source folder, folder modification time, sorted image names)
+# •The Batch Render panel redraws constantly, so the folder is only listed again when its contents change
+batch_images_cache = ['', -1, []]
+
+# Returns the sorted list of supported images in the source folder, or None if the folder doesn't exist
+# •The cache is only for panel redraws; folder modification times are coarse or cached on some filesystems (FAT32, HFS+, network shares)
+# •Batch rendering passes use_cache=False so the render queue always matches the folder contents
+def getBatchImages(source_folder, use_cache=True):
+	try:
+		folder_stat = os.stat(source_folder)
+	except OSError:
+		return None
+	if not S_ISDIR(folder_stat.st_mode):
+		return None
+	
+	# Adding, removing, or renaming files updates the folder modification time
+	if not use_cache or batch_images_cache[0] != source_folder or batch_images_cache[1] != folder_stat.st_mtime_ns:
+		# Scandir entries carry their file type from the directory read, so folders with image-like names are skipped without extra stat calls
+		with os.scandir(source_folder) as entries:
+			source_images = [entry.name for entry in entries if entry.name.lower().endswith(BATCH_IMAGE_EXTENSIONS) and entry.is_file()]
+		source_images.sort()
+		batch_images_cache[:] = [source_folder, folder_stat.st_mtime_ns, source_images]
+	
+	return batch_images_cache[2]
+
+# Returns the batch source cameras (or non-camera items) and whether they came from the active collection instead of the selection
+# •Selected objects take priority, falling back to the active collection when none of the selection matches
+# •Shared by the render, camera update, and panel code so each only filters the objects once
+def getBatchObjects(context, cameras=True):
+	source_objects = [obj for obj in context.selected_objects if (obj.type == 'CAMERA') == cameras]
+	if source_objects or not context.view_layer.active_layer_collection:
+		return source_objects, False
+	return [obj for obj in context.view_layer.active_layer_collection.collection.all_objects if (obj.type == 'CAMERA') == cameras], True
 
 
 
@@ -51,16 +91,11 @@ class batch_render_start(bpy.types.Operator):
 			original_resolution_x = context.scene.render.resolution_x
 			original_resolution_y = context.scene.render.resolution_y
 			
-			# If cameras are selected
-			if len(context.selected_objects) > 0 and len([obj for obj in context.selected_objects if obj.type == 'CAMERA']) > 0:
-				source_cameras = [obj for obj in context.selected_objects if obj.type == 'CAMERA']
-			
-			# If no cameras are selected, check for an active collection with cameras
-			elif context.view_layer.active_layer_collection and len(context.view_layer.active_layer_collection.collection.all_objects) > 0 and len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA']) > 0:
-				source_cameras = [obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA']
+			# Get selected cameras, or cameras in the active collection if none are selected
+			source_cameras, _ = getBatchObjects(context, cameras=True)
 			
-			# If still no cameras are available, return cancelled
-			else:
+			# If no cameras are available, return cancelled
+			if not source_cameras:
 				settings.batch_active = False
 				print('Render Kit Batch: Cameras not found.')
 				return {'CANCELLED'}
@@ -194,16 +229,11 @@ class batch_render_start(bpy.types.Operator):
 			# Preserve active item
 			original_active = context.view_layer.objects.active
 			
-			# If non-camera items are selected
-			if len(context.selected_objects) > 0 and len([obj for obj in context.selected_objects if obj.type != 'CAMERA']) > 0:
-				source_items = [obj for obj in context.selected_objects if obj.type != 'CAMERA']
-			
-			# If no items are selected, check for an active collection with non-camera items
-			elif context.view_layer.active_layer_collection and len(context.view_layer.active_layer_collection.collection.all_objects) > 0 and len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type != 'CAMERA']) > 0:
-				source_items = [obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type != 'CAMERA']
+			# Get selected non-camera items, or non-camera items in the active collection if none are selected
+			source_items, _ = getBatchObjects(context, cameras=False)
 			
-			# If still no items are available, return cancelled
-			else:
+			# If no items are available, return cancelled
+			if not source_items:
 				settings.batch_active = False
 				print('Render Kit Batch: Items not found.')
 				return {'CANCELLED'}
@@ -265,13 +295,8 @@ class batch_render_start(bpy.types.Operator):
 		if settings.batch_type == 'imgs':
 			# Get source folder and target names
 			source_folder = bpy.path.abspath(settings.batch_images_location)
-			source_images = []
-			if os.path.isdir(source_folder):
-				# Image extensions attribute is undocumented
-				# https://blenderartists.org/t/bpy-ops-image-open-supported-formats/1237197/6
-				source_images = [f for f in os.listdir(source_folder) if f.lower().endswith(tuple(bpy.path.extensions_image))]
-				source_images.sort()
-			else:
+			source_images = getBatchImages(source_folder, use_cache=False)
+			if source_images is None:
 				settings.batch_active = False
 				print('Render Kit Batch: Image source directory not found.')
 				return {'CANCELLED'}
@@ -380,16 +405,11 @@ class batch_camera_update(bpy.types.Operator):
 		
 		# If offset, get previous or next camera from selection or collection
 		if self.list_offset != 0:
-			# If cameras are selected
-			if len(context.selected_objects) > 0 and len([obj for obj in context.selected_objects if obj.type == 'CAMERA']) > 0:
-				source_cameras = [obj for obj in context.selected_objects if obj.type == 'CAMERA']
+			# Get selected cameras, or cameras in the active collection if none are selected
+			source_cameras, _ = getBatchObjects(context, cameras=True)
 			
-			# If no cameras are selected, check for an active collection with cameras
-			elif context.view_layer.active_layer_collection and len(context.view_layer.active_layer_collection.collection.all_objects) > 0 and len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA']) > 0:
-				source_cameras = [obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA']
-			
-			# If still no cameras are available, return cancelled
-			else:
+			# If no cameras are available, return cancelled
+			if not source_cameras:
 				settings.batch_active = False
 				print('Render Kit Batch: Cameras not found.')
 				return {'CANCELLED'}
@@ -480,11 +500,12 @@ class BATCH_PT_batch_render(bpy.types.Panel):
 			
 			# Settings for Cameras
 			if settings.batch_type == 'cams':
-				# Direct selection of cameras
-				batch_count = len([obj for obj in context.selected_objects if obj.type == 'CAMERA'])
+				# Direct selection of cameras, or cameras in the active collection if none are selected
+				source_objects, from_collection = getBatchObjects(context, cameras=True)
+				batch_count = len(source_objects)
 				
 				# Set up feedback message for selected cameras
-				if batch_count > 0:
+				if batch_count > 0 and not from_collection:
 					if batch_count == 1:
 						feedback_text=str(batch_count) + ' camera selected'
 					else:
@@ -492,8 +513,7 @@ class BATCH_PT_batch_render(bpy.types.Panel):
 					feedback_icon='CAMERA_DATA' # Alt: VIEW_CAMERA
 				
 				# If no cameras are selected, check for an active collection
-				elif context.view_layer.active_layer_collection and len(context.view_layer.active_layer_collection.collection.all_objects) > 0 and len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA']) > 0:
-					batch_count = len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type == 'CAMERA'])
+				elif batch_count > 0:
 					if batch_count == 1:
 						feedback_text=str(batch_count) + ' camera in collection'
 					else:
@@ -551,11 +571,12 @@ class BATCH_PT_batch_render(bpy.types.Panel):
 			
 			# Settings for Items
 			if settings.batch_type == 'itms':
-				# Direct selection of items
-				batch_count = len([obj for obj in context.selected_objects if obj.type != 'CAMERA'])
+				# Direct selection of items, or items in the active collection if none are selected
+				source_objects, from_collection = getBatchObjects(context, cameras=False)
+				batch_count = len(source_objects)
 				
 				# Set up feedback message for selected items
-				if batch_count > 0:
+				if batch_count > 0 and not from_collection:
 					if batch_count == 1:
 						feedback_text=str(batch_count) + ' item selected'
 					else:
@@ -563,8 +584,7 @@ class BATCH_PT_batch_render(bpy.types.Panel):
 					feedback_icon='OBJECT_DATA'
 				
 				# If no items are selected, check for an active collection
-				elif context.view_layer.active_layer_collection and len(context.view_layer.active_layer_collection.collection.all_objects) > 0 and len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type != 'CAMERA']) > 0:
-					batch_count = len([obj for obj in context.view_layer.active_layer_collection.collection.all_objects if obj.type != 'CAMERA'])
+				elif batch_count > 0:
 					if batch_count == 1:
 						feedback_text=str(batch_count) + ' item in collection'
 					else:
@@ -587,10 +607,8 @@ class BATCH_PT_batch_render(bpy.types.Panel):
 				
 				# Get source folder and image count
 				source_folder = bpy.path.abspath(settings.batch_images_location)
-				if os.path.isdir(source_folder):
-					# Image extensions attribute is undocumented
-					# https://blenderartists.org/t/bpy-ops-image-open-supported-formats/1237197/6
-					source_images = [f for f in os.listdir(source_folder) if f.lower().endswith(tuple(bpy.path.extensions_image))]
+				source_images = getBatchImages(source_folder)
+				if source_images is not None:
 					batch_count = len(source_images)
 					feedback_text=str(batch_count) + ' images found'
 					feedback_icon='IMAGE_DATA'
@@ -45,8 +45,12 @@ class RENDERKIT_OT_render_node(bpy.types.Operator):
 			self.report({'ERROR'}, "Render Kit — Render Node no active node selected")
 			return {'CANCELLED'}
 		
+		# Index the node outputs by name once for both the existence check and socket lookup below
+		# Later sockets overwrite earlier ones with the same name, matching the original lookup order
+		original_node_output = {output.name: output for output in source_node.outputs}
+		
 		# Check if the selected output exists
-		if settings.node_output not in [output.name for output in source_node.outputs]:
+		if settings.node_output not in original_node_output:
 			self.report({'ERROR'}, f"Render Kit — Render Node output '{settings.node_output}' not found")
 			return {'CANCELLED'}
 		
@@ -68,7 +72,6 @@ class RENDERKIT_OT_render_node(bpy.types.Operator):
 		file_path = replaceVariables(file_path) # Must be completed before the active nodes change
 		
 		# Get the output socket by name
-		original_node_output = {output.name: output for output in source_node.outputs}
 		output_socket = original_node_output[settings.node_output]
 		
 		# Set active output type
@@ -304,7 +307,7 @@ class RENDERKIT_PT_render_node(bpy.types.Panel):
 				obj_valid = False
 			if obj.hide_render:
 				obj_valid = False
-		if settings.node_output not in [output.name for output in context.active_node.outputs] or not obj_valid or not context.active_object.data.uv_layers.get(settings.node_uvmap):
+		if context.active_node.outputs.get(settings.node_output) is None or not obj_valid or not context.active_object.data.uv_layers.get(settings.node_uvmap):
 			button.active = False
 			button.enabled = False
 		button.operator(RENDERKIT_OT_render_node.bl_idname)
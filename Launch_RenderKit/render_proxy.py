@@ -30,13 +30,9 @@ class render_proxy_start(bpy.types.Operator):
 		bpy.context.scene.render.engine = str(prefs.proxy_renderEngine)
 		bpy.context.scene.eevee.taa_render_samples = prefs.proxy_renderSamples
 		
-		# Override original file format settings
-		if prefs.proxy_format == 'JPEG':
-			bpy.context.scene.render.image_settings.file_format = 'JPEG'
-		elif prefs.proxy_format == 'PNG':
-			bpy.context.scene.render.image_settings.file_format = 'PNG'
-		elif prefs.proxy_format == 'OPEN_EXR_MULTILAYER':
-			bpy.context.scene.render.image_settings.file_format = 'OPEN_EXR_MULTILAYER'
+		# Override original file format settings (preference values match the Blender format identifiers)
+		if prefs.proxy_format != 'SCENE':
+			bpy.context.scene.render.image_settings.file_format = prefs.proxy_format
 		
 		# Override original resolution multiplier settings
 		bpy.context.scene.render.resolution_percentage = prefs.proxy_resolutionMultiplier
@@ -13,14 +13,16 @@ class RENDER_PT_render_region(bpy.types.Panel):
 		# self.layout.prop(bpy.context.scene.render, 'use_border', text='')
 	
 	def draw(self, context):
-		if bpy.context.scene.render.use_border and context.preferences.addons[__package__].preferences.region_enable:
+		# Resolve the render settings once per redraw
+		render = context.scene.render
+		if render.use_border and context.preferences.addons[__package__].preferences.region_enable:
 			layout = self.layout
 			layout.use_property_decorate = False  # No animation
 			layout.use_property_split = True
 			
 			row0 = layout.row(align=True, heading='')
-			row0.prop(bpy.context.scene.render, 'border_min_x', text='Region X')
-			row0.prop(bpy.context.scene.render, 'border_max_x', text='')
+			row0.prop(render, 'border_min_x', text='Region X')
+			row0.prop(render, 'border_max_x', text='')
 			row1 = layout.row(align=True, heading='')
-			row1.prop(bpy.context.scene.render, 'border_min_y', text='Region Y')
-			row1.prop(bpy.context.scene.render, 'border_max_y', text='')
+			row1.prop(render, 'border_min_y', text='Region Y')
+			row1.prop(render, 'border_max_y', text='')
@@ -8,11 +8,15 @@ from pathlib import Path
 
 # Variable data
 import platform
-from re import findall, search, sub
+from re import compile as re_compile, sub
 
 # Internal imports
 from .utility_time import secondsToStrings
 
+# Patterns compiled once at load time since variable replacement runs for every output path on every frame
+SANITIZE_PATTERN = re_compile(r'[<>:"/\\\|?*]+')
+PROPERTY_PATTERN = re_compile(r"\{([a-z])(\d)\}")
+
 
 
 # Available variables
@@ -29,6 +33,10 @@ variableArray = ["title,Project,SCENE_DATA",
 					"{date}", "{y},{m},{d}", "{time}", "{H},{M},{S}", "{serial}", "{frame}", "{batch}",
 				]
 
+# Variable list split into its display parts once at load time instead of during every popup redraw
+# •Each entry is (original string, header flag, comma separated parts)
+variableRows = [(item, item.startswith('title,'), item.split(',')) for item in variableArray]
+
 
 
 # Available values
@@ -45,6 +53,28 @@ valueArray =   ["title,Scene,SCENE_DATA",
 
 valueName = "RenderKit_Value_"
 
+# Value list split into display parts and custom property names once at load time instead of during every popup redraw
+# •Each entry is (original string, header flag, comma separated parts, custom property name)
+valueRows = [(item, item.startswith('title,'), item.split(','), valueName + sub("\\D", "", item)) for item in valueArray]
+
+
+
+# System variable values
+# •These can't change while Blender is running, so they're looked up on first use and reused for every replacement
+# •Avoids repeated platform queries (macOS version lookups read from disk each time)
+# •The host name can change (moving between networks), so {host} is looked up during each replacement instead
+systemVariables = {}
+
+def getSystemVariables():
+	if not systemVariables:
+		systemVariables["{processor}"] = platform.processor() # Alternate: platform.machine() provides the same information in many cases
+		systemVariables["{platform}"] = platform.platform()
+		systemVariables["{system}"] = platform.system().replace("Darwin", "macOS") # Alternate: {os}
+		systemVariables["{release}"] = platform.mac_ver()[0] if platform.system() == "Darwin" else platform.release() # Alternate: {system}
+		systemVariables["{python}"] = platform.python_version()
+		systemVariables["{blender}"] = bpy.app.version_string + '-' + bpy.app.version_cycle
+	return systemVariables
+
 
 ###########################################################################
 # Variable replacement function
@@ -54,25 +84,30 @@ valueName = "RenderKit_Value_"
 # 	•Replaces {serial} only if valid 0+ integer is provided
 
 def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
+	# Every variable is wrapped in brackets, so plain paths can skip the scene, engine, and item lookups entirely
+	if '{' not in string:
+		return string
+	
 	context = bpy.context
 	view_layer = context.view_layer
 	scene = context.scene
 	settings = scene.render_kit_settings
 	
-	# Get render engine feature sets
-	if bpy.context.engine == 'BLENDER_WORKBENCH':
+	# Get render engine feature sets (engine is read once rather than for every comparison below)
+	engine = context.engine
+	if engine == 'BLENDER_WORKBENCH':
 		renderEngine = 'Workbench'
 		renderDevice = 'GPU'
 		renderSamples = scene.display.render_aa
 		renderFeatures = scene.display.shading.light.title().replace("Matcap", "MatCap") + '+' + scene.display.shading.color_type.title()
 	
-	elif bpy.context.engine == 'HYDRA_STORM':
+	elif engine == 'HYDRA_STORM':
 		renderEngine = 'HydraStorm'
 		renderDevice = 'GPU'
 		renderSamples = str(scene.hydra_storm.final.max_lights)
 		renderFeatures = str(scene.hydra_storm.final.volume_raymarching_step_size) + '+' + str(scene.hydra_storm.final.volume_raymarching_step_size_lighting) + '+' + str(scene.hydra_storm.final.volume_max_texture_memory_per_field)
 	
-	elif bpy.context.engine == 'BLENDER_EEVEE':
+	elif engine == 'BLENDER_EEVEE':
 		renderEngine = 'Eevee'
 		renderDevice = 'GPU'
 		renderSamples = str(scene.eevee.taa_render_samples) + '+' + str(scene.eevee.sss_samples) + '+' + str(scene.eevee.volumetric_samples)
@@ -87,7 +122,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 			renderFeaturesArray.append('MB' + str(scene.eevee.motion_blur_steps))
 		renderFeatures = 'none' if len(renderFeaturesArray) == 0 else '+'.join(renderFeaturesArray)
 	
-	elif bpy.context.engine == 'BLENDER_EEVEE':
+	elif engine == 'BLENDER_EEVEE':
 		renderEngine = 'Eevee'
 		renderDevice = 'GPU'
 		renderSamples = str(scene.eevee.taa_render_samples) + '+' + str(scene.eevee.shadow_ray_count) + '+' + str(scene.eevee.shadow_step_count) + '+' + str(scene.eevee.volumetric_shadow_samples) + '+' + str(scene.eevee.shadow_resolution_scale)# + '+' + str(scene.eevee.volumetric_samples)
@@ -102,7 +137,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 			renderFeaturesArray.append('MB' + str(scene.eevee.motion_blur_steps))
 		renderFeatures = 'none' if len(renderFeaturesArray) == 0 else '+'.join(renderFeaturesArray)
 	
-	elif bpy.context.engine == 'BLENDER_EEVEE_NEXT':
+	elif engine == 'BLENDER_EEVEE_NEXT':
 		renderEngine = 'EeveeNext'
 		renderDevice = 'GPU'
 		renderSamples = str(scene.eevee.taa_samples) + '+' + str(scene.eevee.use_taa_reprojection) + '+' + str(scene.eevee.use_shadow_jitter_viewport) + '+' + str(scene.eevee.volumetric_tile_size) + '+' + str(scene.eevee.volumetric_samples) + '+' + ("%.2f" % scene.eevee.volumetric_sample_distribution) + '+' + str(scene.eevee.volumetric_ray_depth)
@@ -111,7 +146,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 		else:
 			renderFeatures = 'NoRT'
 	
-	elif bpy.context.engine == 'CYCLES':
+	elif engine == 'CYCLES':
 		renderEngine = 'Cycles'
 		renderDevice = scene.cycles.device
 		# Add compute device type if GPU is enabled
@@ -120,7 +155,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 		renderSamples = str(round(scene.cycles.adaptive_threshold, 4)) + '+' + str(scene.cycles.samples) + '+' + str(scene.cycles.adaptive_min_samples)
 		renderFeatures = str(scene.cycles.max_bounces) + '+' + str(scene.cycles.diffuse_bounces) + '+' + str(scene.cycles.glossy_bounces) + '+' + str(scene.cycles.transmission_bounces) + '+' + str(scene.cycles.volume_bounces) + '+' + str(scene.cycles.transparent_max_bounces)
 	
-	elif bpy.context.engine == 'RPR':
+	elif engine == 'RPR':
 		renderEngine = 'ProRender'
 		# Compile array of enabled devices
 		renderDevicesArray = []
@@ -133,7 +168,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 		renderSamples = str(scene.rpr.limits.min_samples) + '+' + str(scene.rpr.limits.max_samples) + '+' + str(round(scene.rpr.limits.noise_threshold, 4))
 		renderFeatures = str(scene.rpr.max_ray_depth) + '+' + str(scene.rpr.diffuse_depth) + '+' + str(scene.rpr.glossy_depth) + '+' + str(scene.rpr.refraction_depth) + '+' + str(scene.rpr.glossy_refraction_depth) + '+' + str(scene.rpr.shadow_depth)
 	
-	elif bpy.context.engine == 'LUXCORE':
+	elif engine == 'LUXCORE':
 		renderEngine = 'LuxCore'
 		renderDevice = 'CPU' if scene.luxcore.config.device == 'CPU' else 'GPU'
 		# Samples returns the halt conditions for time, samples, and/or noise threshold
@@ -159,7 +194,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 			renderFeatures += '+' + str(scene.luxcore.denoiser.type)
 	
 	else:
-		renderEngine = bpy.context.engine
+		renderEngine = engine
 		renderDevice = 'unknown'
 		renderSamples = 'unknown'
 		renderFeatures = 'unknown'
@@ -171,14 +206,14 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 		obj = view_layer.objects.active
 		
 		# Set active object name
-		projectItem = sub(r'[<>:"/\\\|?*]+', "-", obj.name) # Sanitise the most commonly problematic filesystem characters (Microsoft Windows is just the worst)
+		projectItem = SANITIZE_PATTERN.sub("-", obj.name) # Sanitise the most commonly problematic filesystem characters (Microsoft Windows is just the worst)
 		
 		if obj.active_material:
 			# Set active material
 			mat = obj.active_material
 			
 			# Set active material slot name
-			projectMaterial = sub(r'[<>:"/\\\|?*]+', "-", mat.name) # Sanitised
+			projectMaterial = SANITIZE_PATTERN.sub("-", mat.name) # Sanitised
 			
 			if mat.use_nodes and mat.node_tree.nodes.active:
 				# Set active node tree node
@@ -200,7 +235,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 				else:
 					projectNode = node.name.replace(" ", "_")
 				# Spaces are replaced with underscores only for the two naming options that are not user-defined
-				projectNode = sub(r'[<>:"/\\\|?*]+', "-", projectNode) # Sanitised
+				projectNode = SANITIZE_PATTERN.sub("-", projectNode) # Sanitised
 	
 	# Set node name to the Batch Render Target if active and available
 	if settings.batch_active and settings.batch_type == 'imgs' and bpy.data.materials.get(settings.batch_images_material) and bpy.data.materials[settings.batch_images_material].node_tree.nodes.get(settings.batch_images_node):
@@ -253,7 +288,7 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 	
 	
 	# Image variables
-	sceneOverride = scene.render.image_settings if bpy.context.scene.render.image_settings.color_management == "OVERRIDE" else scene
+	sceneOverride = scene.render.image_settings if scene.render.image_settings.color_management == "OVERRIDE" else scene
 	string = string.replace("{display}", sceneOverride.display_settings.display_device.replace(" ", "").replace(".", ""))
 	string = string.replace("{space}", sceneOverride.view_settings.view_transform.replace(" ", ""))
 	string = string.replace("{look}", sceneOverride.view_settings.look.replace(" ", "").replace("AgX-", "").replace("FalseColor-", ""))
@@ -281,30 +316,28 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 	
 	# System variables
 	string = string.replace("{host}", platform.node().split('.')[0])
-	string = string.replace("{processor}", platform.processor()) # Alternate: platform.machine() provides the same information in many cases
-	string = string.replace("{platform}", platform.platform())
-	string = string.replace("{system}", platform.system().replace("Darwin", "macOS")) # Alternate: {os}
-	string = string.replace("{release}", platform.mac_ver()[0] if platform.system() == "Darwin" else platform.release()) # Alternate: {system}
-	string = string.replace("{python}", platform.python_version())
-	string = string.replace("{blender}", bpy.app.version_string + '-' + bpy.app.version_cycle)
+	for variable, value in getSystemVariables().items():
+		string = string.replace(variable, value)
 	
 	
 	
 	# Identifier variables
-	string = string.replace("{date}", datetime.datetime.now().strftime('%Y-%m-%d'))
+	# Capture the current time once so every date and time variable in the string matches
+	now = datetime.datetime.now()
+	string = string.replace("{date}", now.strftime('%Y-%m-%d'))
 	string = string.replace("{year}", "{y}") # Alternative variable
-	string = string.replace("{y}", datetime.datetime.now().strftime('%Y'))
+	string = string.replace("{y}", now.strftime('%Y'))
 	string = string.replace("{month}", "{m}") # Alternative variable
-	string = string.replace("{m}", datetime.datetime.now().strftime('%m'))
+	string = string.replace("{m}", now.strftime('%m'))
 	string = string.replace("{day}", "{d}") # Alternative variable
-	string = string.replace("{d}", datetime.datetime.now().strftime('%d'))
-	string = string.replace("{time}", datetime.datetime.now().strftime('%H-%M-%S'))
+	string = string.replace("{d}", now.strftime('%d'))
+	string = string.replace("{time}", now.strftime('%H-%M-%S'))
 	string = string.replace("{hour}", "{H}") # Alternative variable
-	string = string.replace("{H}", datetime.datetime.now().strftime('%H'))
+	string = string.replace("{H}", now.strftime('%H'))
 	string = string.replace("{minute}", "{M}") # Alternative variable
-	string = string.replace("{M}", datetime.datetime.now().strftime('%M'))
+	string = string.replace("{M}", now.strftime('%M'))
 	string = string.replace("{second}", "{S}") # Alternative variable
-	string = string.replace("{S}", datetime.datetime.now().strftime('%S'))
+	string = string.replace("{S}", now.strftime('%S'))
 	if serial >= 0: # Only enabled if a value is supplied
 		string = string.replace("{serial}", format(serial, '04'))
 	string = string.replace("{frame}", format(scene_frame, '04'))
@@ -315,26 +348,28 @@ def replaceVariables(string, render_time=-1.0, serial=-1, socket=''):
 	
 	
 	# Value properties
-	property_pattern = r"\{([a-z])(\d)\}"
+	# Resolve the active item and material once instead of for every property variable found
+	active_object = view_layer.objects.active
+	active_material = active_object.active_material if active_object else None
 	def get_property_value(match):
 		type = f"{match.group(1)}"
 		property = f"{valueName}{match.group(2)}"
 		value = ""
-		if type == 's' and property in context.scene:
-			value = context.scene[property]
-		elif type == 'v' and property in context.view_layer:
-			value = context.view_layer[property]
-		elif (type == 'i' or type == 'o') and context.view_layer.objects.active and property in context.view_layer.objects.active:
-			value = context.view_layer.objects.active[property]
-		elif type == 'm' and context.view_layer.objects.active and context.view_layer.objects.active.active_material and property in context.view_layer.objects.active.active_material:
-			value = context.view_layer.objects.active.active_material[property]
+		if type == 's' and property in scene:
+			value = scene[property]
+		elif type == 'v' and property in view_layer:
+			value = view_layer[property]
+		elif (type == 'i' or type == 'o') and active_object and property in active_object:
+			value = active_object[property]
+		elif type == 'm' and active_material and property in active_material:
+			value = active_material[property]
 		else:
 			value = 'none'
 #		value = str(value)
 		value = f"{value}"
-		value = sub(r'[<>:"/\\\|?*]+', "-", value) # Rudimentary sanitisation, this feature is pretty insecure
+		value = SANITIZE_PATTERN.sub("-", value) # Rudimentary sanitisation, this feature is pretty insecure
 		return value
-	string = sub(property_pattern, get_property_value, string)
+	string = PROPERTY_PATTERN.sub(get_property_value, string)
 	
 	
 	
@@ -404,17 +439,16 @@ class VariablePopup(bpy.types.Operator):
 	def draw(self, context):
 		layout = self.layout
 		grid = self.layout.grid_flow(row_major=True, columns = 5, even_columns = True, even_rows = True)
-		for item in variableArray:
+		for item, title, x in variableRows:
 			# Display headers
-			if item.startswith('title,'):
-				x = item.split(',')
+			if title:
 				col = grid.column()
 				col.label(text = x[1], icon = x[2])
 			# Display list elements (filtering out time and node socket variables unless specifically enabled)
 			elif (item not in ["{duration}", "{rtime}", "{rH},{rM},{rS}"] or self.postrender) and (item not in ["{socket}"] or self.noderender):
-				if ',' in item:
+				if len(x) > 1:
 					subrow = col.row(align = True)
-					for subitem in item.split(','):
+					for subitem in x:
 						ops = subrow.operator(CopyVariableToClipboard.bl_idname, text=subitem, emboss=False)
 						ops.string = subitem
 						ops.close = self.autoclose
@@ -485,11 +519,10 @@ class ValuePopup(bpy.types.Operator):
 		# Set first-property tracker to ensure just one "add property" button is added to each column
 		property_first = False
 		
-		for item in valueArray:
+		for item, title, x, property_name in valueRows:
 			
 			# Display headers
-			if item.startswith('title,'):
-				x = item.split(',')
+			if title:
 				col = grid.column()
 				col.label(text = x[1], icon = x[2])
 				# Reset the property button tracking
@@ -522,12 +555,6 @@ class ValuePopup(bpy.types.Operator):
 				if target != None:
 					target_name = target.name
 				
-				# Get the property number
-				number = sub("\\D", "", item)
-				
-				# Define the property name
-				property_name = f"{valueName}{number}"
-				
 				# Check for existing property
 				if property_name in target:
 					# Start a new row in the column
@@ -679,10 +706,7 @@ def NODE_PT_output_path_variable_list(self, context):
 		if isinstance(active_node, bpy.types.CompositorNodeOutputFile):
 #		if active_node.type == 'OUTPUT_FILE':
 			# Get file path and all output file names from the current active node
-			paths = [context.scene.node_tree.nodes.active.base_path]
-			for slot in context.scene.node_tree.nodes.active.file_slots:
-				paths.append(slot.path)
-			paths = ''.join(paths)
+			paths = active_node.base_path + ''.join(slot.path for slot in active_node.file_slots)
 			
 			# Variable list UI
 			renderkit_variable_ui(self.layout, context, paths=paths, postrender=False, noderender=False, autoclose=True)
@@ -53,9 +53,7 @@ def processFFmpeg(render_path='', render_time=-1):
 				# Convert relative path into absolute path for Python and CLI compatibility
 				output_path = bpy.path.abspath(output_path)
 				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
+				os.makedirs(os.path.dirname(output_path), exist_ok=True)
 				# Wrap with FFmpeg settings
 				output_path = '-y "' + output_path + '"'
 			
@@ -97,9 +95,7 @@ def processFFmpeg(render_path='', render_time=-1):
 				# Convert relative path into absolute path for Python and CLI compatibility
 				output_path = bpy.path.abspath(output_path)
 				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
+				os.makedirs(os.path.dirname(output_path), exist_ok=True)
 				# Wrap with FFmpeg settings
 				output_path = '-y "' + output_path + '"'
 			
@@ -141,9 +137,7 @@ def processFFmpeg(render_path='', render_time=-1):
 				# Convert relative path into absolute path for Python and CLI compatibility
 				output_path = bpy.path.abspath(output_path)
 				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
+				os.makedirs(os.path.dirname(output_path), exist_ok=True)
 				# Wrap with FFmpeg settings
 				output_path = '-y "' + output_path + '"'
 			
@@ -6,7 +6,10 @@
 
 import bpy
 import os
-from re import search
+from re import compile as re_compile
+
+# Trailing serial number pattern, compiled once instead of per directory entry
+SERIAL_PATTERN = re_compile(r'(\d+)(?=\D*$)')
 
 def checkExistingAndIncrement(path, overwrite=False):
 	abs_path = bpy.path.abspath(path)
@@ -15,14 +18,14 @@ def checkExistingAndIncrement(path, overwrite=False):
 	
 	if not os.path.exists(abs_dir):
 		os.makedirs(abs_dir)
-	elif os.path.isfile(abs_path) and not overwrite:
+	# The overwrite flag is checked first so the file isn't stat'd when it would be replaced anyway
+	elif not overwrite and os.path.isfile(abs_path):
 		# If the file exists, determine the correct serial number to increment
 		serial = -1
 		for file in os.listdir(abs_dir):
 			if file.startswith(abs_name):
 				# If incremented files exist, continue to increment
-				('check file: ', file)
-				match = search(r'(\d+)(?=\D*$)', file)
+				match = SERIAL_PATTERN.search(file)
 				if match:
 					serial = max(serial, int(match.group(1)))
 		
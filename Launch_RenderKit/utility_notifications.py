@@ -1,6 +1,7 @@
 # General features
 import bpy
 #import json
+import threading
 
 # Email notifications
 import smtplib
@@ -10,7 +11,10 @@ from email.mime.text import MIMEText
 import requests
 
 # Command line voice access
-import os
+import subprocess
+
+# Local imports
+from .render_variables import replaceVariables
 
 
 
@@ -19,6 +23,9 @@ import os
 # •Send email notification
 # •Send Pushover notification
 # •Speak audible message
+# Network notifications are delivered from background threads so Blender isn't blocked waiting on each server in turn
+# •Command line renders deliver synchronously since Blender quits as soon as the render completes
+# •Threads are non-daemon so Python waits for any in-progress delivery when Blender is closed
 
 def render_notifications(render_time=-1.0):
 	prefs = bpy.context.preferences.addons[__package__].preferences
@@ -64,48 +71,66 @@ def render_notifications(render_time=-1.0):
 
 
 
+def deliver(function, args):
+	if bpy.app.background:
+		function(*args)
+	else:
+		threading.Thread(target=function, args=args).start()
+
+
+
 def send_email(subject, message):
 	if bpy.app.online_access:
 		prefs = bpy.context.preferences.addons[__package__].preferences
-		try:
-			msg = MIMEText(message)
-			msg['Subject'] = subject
-			msg['From'] = prefs.email_from
-			msg['To'] = prefs.email_to
-			with smtplib.SMTP_SSL(prefs.email_server, prefs.email_port) as smtp_server:
-				smtp_server.login(prefs.email_from, prefs.email_password)
-				smtp_server.sendmail(prefs.email_from, prefs.email_to.split(', '), msg.as_string())
-		except Exception as exc:
-			print(str(exc) + " | Error in Render Kit Notifications: failed to send email notification")
+		# Preferences are read here on the main thread, only the server connection happens in the background
+		msg = MIMEText(message)
+		msg['Subject'] = subject
+		msg['From'] = prefs.email_from
+		msg['To'] = prefs.email_to
+		deliver(deliver_email, (prefs.email_server, prefs.email_port, prefs.email_from, prefs.email_password, prefs.email_to.split(', '), msg.as_string()))
+
+def deliver_email(server, port, sender, password, recipients, message):
+	try:
+		with smtplib.SMTP_SSL(server, port, timeout = 30) as smtp_server:
+			smtp_server.login(sender, password)
+			smtp_server.sendmail(sender, recipients, message)
+	except Exception as exc:
+		print(str(exc) + " | Error in Render Kit Notifications: failed to send email notification")
 
 
 
 def send_pushover(subject, message):
 	if bpy.app.online_access:
 		prefs = bpy.context.preferences.addons[__package__].preferences
-		try:
-			r = requests.post('https://api.pushover.net/1/messages.json', data = {
-				"token": prefs.pushover_app,
-				"user": prefs.pushover_key,
-				"title": subject,
-				"message": message
-			})
-			if r.status_code == 200:
-				print(r.text)
-			if r.status_code == 500:
-				print('Error in Render Kit Notifications: Pushover notification service unavailable')
-				print(r.text)
-			else:
-				print('Error in Render Kit Notifications: Pushover URL request failed')
-				print(r.text)
-		except Exception as exc:
-			print(str(exc) + " | Error in Render Kit Notifications: failed to send Pushover notification")
+		# Preferences are read here on the main thread, only the web request happens in the background
+		data = {
+			"token": prefs.pushover_app,
+			"user": prefs.pushover_key,
+			"title": subject,
+			"message": message
+		}
+		deliver(deliver_pushover, (data,))
+
+def deliver_pushover(data):
+	try:
+		r = requests.post('https://api.pushover.net/1/messages.json', data = data, timeout = 30)
+		if r.status_code == 200:
+			print(r.text)
+		if r.status_code == 500:
+			print('Error in Render Kit Notifications: Pushover notification service unavailable')
+			print(r.text)
+		else:
+			print('Error in Render Kit Notifications: Pushover URL request failed')
+			print(r.text)
+	except Exception as exc:
+		print(str(exc) + " | Error in Render Kit Notifications: failed to send Pushover notification")
 
 
 
 def voice_say(message):
 	# This can be expanded to support other systems if needed, but right now it's MacOS exclusive
+	# Started as a separate process so the render complete handler doesn't wait for the announcement to finish speaking
 	try:
-		os.system('say "' + message + '"')
+		subprocess.Popen(['say', message])
 	except Exception as exc:
-		print(str(exc) + " | Error in Render Kit Notifications: failed to send Pushover notification")
\ No newline at end of file
+		print(str(exc) + " | Error in Render Kit Notifications: failed to speak voice notification")
\ No newline at end of file